@@ -0,0 +1,55 @@
+"""
+Django settings for running the todo_project test suite.
+
+Used automatically by ``manage.py test`` and by pytest (see pytest.ini):
+an in-memory database built straight from the current models, a fast
+password hasher and the minimal middleware stack the views (and the
+admin system checks) need.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+
+class DisableMigrations:
+    """Report every app as having no migrations so tables are created directly."""
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+MIGRATION_MODULES = DisableMigrations()
+
+# Skips tests tagged 'slow' unless --tag/--exclude-tag is given.
+TEST_RUNNER = 'todo_project.test_runner.TodoTestRunner'
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+MIDDLEWARE = [
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+]
+
+# Fail any request that lazily loads related rows one at a time, when the
+# optional nplusone package is installed (`pip install nplusone`).
+try:
+    import nplusone  # noqa: F401
+except ImportError:
+    pass
+else:
+    INSTALLED_APPS = INSTALLED_APPS + ['nplusone.ext.django']
+    MIDDLEWARE = ['nplusone.ext.django.NPlusOneMiddleware'] + MIDDLEWARE
+    NPLUSONE_RAISE = True
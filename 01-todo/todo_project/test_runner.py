@@ -0,0 +1,16 @@
+"""
+Test runner for the todo_project test suite.
+
+Selected through ``TEST_RUNNER`` in settings_test.
+"""
+
+from django.test.runner import DiscoverRunner
+
+
+class TodoTestRunner(DiscoverRunner):
+    """Leave out tests tagged ``slow`` unless tags are chosen explicitly."""
+
+    def __init__(self, tags=None, exclude_tags=None, **kwargs):
+        if not tags and not exclude_tags:
+            exclude_tags = ['slow']
+        super().__init__(tags=tags, exclude_tags=exclude_tags, **kwargs)
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-15 09:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='todo',
+            name='due_date',
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(condition=models.Q(('resolved', False)), fields=['due_date'], name='todo_open_due_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-15 09:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0002_alter_todo_due_date_todo_todo_open_due_idx'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='todo',
+            options={'ordering': ['resolved', models.OrderBy(models.F('due_date'), nulls_first=True), 'pk']},
+        ),
+        migrations.RemoveIndex(
+            model_name='todo',
+            name='todo_open_due_idx',
+        ),
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['resolved', 'due_date'], name='todo_res_due_idx'),
+        ),
+    ]
@@ -3,13 +3,17 @@ from django.db import models
 class Todo(models.Model):
     title = models.CharField(max_length=200)
     description = models.TextField(blank=True, null=True)
-    due_date = models.DateField(null=True, blank=True)
+    due_date = models.DateField(null=True, blank=True, db_index=True)
     resolved = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ['due_date']
+        # Open todos first, soonest due first; undated todos lead each group.
+        ordering = ['resolved', models.F('due_date').asc(nulls_first=True), 'pk']
+        indexes = [
+            models.Index(fields=['resolved', 'due_date'], name='todo_res_due_idx'),
+        ]
 
     def __str__(self):
         return self.title
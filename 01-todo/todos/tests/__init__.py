@@ -5,6 +5,7 @@ This package contains all tests organized by component:
 - test_models.py: Model layer tests
 - test_views.py: View layer tests
 - test_forms.py: Form validation tests
+- test_urls.py: URL routing tests
 - test_integration.py: End-to-end workflow tests
 - test_scenarios.py: Edge cases and special scenarios
 - conftest.py: Shared fixtures and utilities
@@ -3,15 +3,34 @@ Shared test configuration and fixtures.
 
 This module provides reusable fixtures, setup, and utility functions
 used across multiple test modules to follow DRY principles.
+
+Everything here is safe under ``manage.py test --parallel``: the
+factories never assume primary key values and nothing touches shared
+files, so each worker only sees its own test database.
+
+Tests that drive views which may register ``transaction.on_commit``
+hooks should stay on ``TestCase`` and wrap the request in
+``self.captureOnCommitCallbacks(execute=True)`` rather than switching
+to the much slower ``TransactionTestCase``::
+
+    with self.captureOnCommitCallbacks(execute=True):
+        response = self.client.post(create_url, data)
 """
 
-from django.test import Client
+from functools import lru_cache
+from django.db.models import Count, Q
+from django.urls import reverse, reverse_lazy
 from django.utils import timezone
 from datetime import timedelta
 from django.test import TestCase
 from ..models import Todo
 
 
+# Titles at and just over Todo.title's max_length
+LONG_TITLE_200 = "A" * 200
+LONG_TITLE_201 = "A" * 201
+
+
 def create_todo(
     title="Default Todo",
     description=None,
@@ -57,16 +76,84 @@ def create_todo_with_due_date(days_from_now=5):
     )
 
 
+def create_todos_bulk(specs):
+    """
+    Create several todos with a single INSERT.
+
+    Args:
+        specs (list[dict]): Keyword arguments for each Todo to create
+
+    Returns:
+        list[Todo]: The created todos, in the order of ``specs``
+    """
+    return Todo.objects.bulk_create([Todo(**spec) for spec in specs])
+
+
+def create_many_todos(count, **kwargs):
+    """
+    Create ``count`` numbered todos ("Task 0", "Task 1", ...) in bulk.
+
+    Args:
+        count (int): Number of todos to create
+        **kwargs: Field values shared by every todo (e.g. resolved=True)
+
+    Returns:
+        list[Todo]: The todos passed to bulk_create
+    """
+    return Todo.objects.bulk_create(
+        [Todo(title=f"Task {i}", **kwargs) for i in range(count)],
+        batch_size=500
+    )
+
+
+def resolved_counts():
+    """
+    Count resolved and unresolved todos in a single query.
+
+    Returns:
+        dict: ``{'resolved': int, 'unresolved': int}``
+    """
+    # The aliases can't reuse the field name "resolved"
+    counts = Todo.objects.aggregate(
+        resolved_count=Count('pk', filter=Q(resolved=True)),
+        unresolved_count=Count('pk', filter=Q(resolved=False))
+    )
+    return {
+        'resolved': counts['resolved_count'],
+        'unresolved': counts['unresolved_count'],
+    }
+
+
+@lru_cache(maxsize=None)
+def cached_reverse(name, *args):
+    """
+    Reverse a URL name, resolving each name/argument combination once.
+
+    The URLconf doesn't change during a test run, so the result can be
+    reused by every test.
+
+    Args:
+        name (str): URL pattern name, e.g. 'todo-edit'
+        *args: Positional URL arguments, e.g. a todo's pk
+
+    Returns:
+        str: The resolved path
+    """
+    return reverse(name, args=args)
+
+
 class BaseTestCase(TestCase):
     """
     Base test case class that provides common setup for all test classes.
 
     This follows the DRY principle by centralizing common test setup.
+    Requests go through Django's per-test ``self.client``.
     """
 
+    list_url = reverse_lazy('todo-list')
+
     def setUp(self):
-        """Initialize test client and common test data."""
-        self.client = Client()
+        """Initialize common test data."""
         self.now = timezone.now()
 
     def assert_redirect_to_list(self, response, follow=False):
@@ -77,9 +164,8 @@ class BaseTestCase(TestCase):
             response: HTTP response object
             follow (bool): Whether to follow redirects
         """
-        from django.urls import reverse
         if not follow:
             self.assertEqual(response.status_code, 302)
-            self.assertEqual(response.url, reverse('todo-list'))
+            self.assertEqual(response.url, self.list_url)
         else:
             self.assertEqual(response.status_code, 200)
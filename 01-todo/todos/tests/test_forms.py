@@ -4,19 +4,28 @@ Tests for Todo forms.
 This module tests form validation, field constraints, and user input handling.
 """
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 from django.utils import timezone
 from datetime import timedelta
 from ..forms import TodoForm
-from .conftest import BaseTestCase
+from .conftest import LONG_TITLE_200, LONG_TITLE_201
 
 
-class TodoFormValidationTests(BaseTestCase):
+_LONG_DESC = "A" * 10000  # Very long description
+
+
+class TodoFormValidationTests(SimpleTestCase):
     """Tests for TodoForm validation."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Compute today's date once for the whole class."""
+        super().setUpClass()
+        cls.today = timezone.now().date()
+
     def test_valid_form_with_all_fields(self):
         """Test form validation with all valid fields."""
-        due_date = (timezone.now() + timedelta(days=5)).date()
+        due_date = self.today + timedelta(days=5)
         form = TodoForm(data={
             'title': 'Test Todo',
             'description': 'Test Description',
@@ -74,39 +83,42 @@ class TodoFormValidationTests(BaseTestCase):
         self.assertTrue(form.is_valid())
 
 
-class TodoFormFieldTests(TestCase):
+class TodoFormFieldTests(SimpleTestCase):
     """Tests for individual form fields."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Compute today's date once for the whole class."""
+        super().setUpClass()
+        cls.today = timezone.now().date()
+
     def test_form_title_field_max_length(self):
         """Test title field respects max_length."""
-        long_title = "A" * 200  # Max length
         form = TodoForm(data={
-            'title': long_title,
+            'title': LONG_TITLE_200,
             'description': 'Valid description'
         })
         self.assertTrue(form.is_valid())
 
     def test_form_title_exceeds_max_length(self):
         """Test title field rejects too long titles."""
-        long_title = "A" * 201  # Over max length
         form = TodoForm(data={
-            'title': long_title,
+            'title': LONG_TITLE_201,
             'description': 'Valid description'
         })
         self.assertFalse(form.is_valid())
 
     def test_form_description_can_be_very_long(self):
         """Test that description accepts large text."""
-        long_description = "A" * 10000  # Very long description
         form = TodoForm(data={
             'title': 'Test Todo',
-            'description': long_description
+            'description': _LONG_DESC
         })
         self.assertTrue(form.is_valid())
 
     def test_form_accepts_past_due_date(self):
         """Test form accepts past dates as due dates."""
-        past_date = (timezone.now() - timedelta(days=5)).date()
+        past_date = self.today - timedelta(days=5)
         form = TodoForm(data={
             'title': 'Test Todo',
             'due_date': past_date
@@ -115,7 +127,7 @@ class TodoFormFieldTests(TestCase):
 
     def test_form_accepts_future_due_date(self):
         """Test form accepts future dates as due dates."""
-        future_date = (timezone.now() + timedelta(days=30)).date()
+        future_date = self.today + timedelta(days=30)
         form = TodoForm(data={
             'title': 'Test Todo',
             'due_date': future_date
@@ -124,48 +136,53 @@ class TodoFormFieldTests(TestCase):
 
     def test_form_accepts_today_as_due_date(self):
         """Test form accepts today's date as due date."""
-        today = timezone.now().date()
         form = TodoForm(data={
             'title': 'Test Todo',
-            'due_date': today
+            'due_date': self.today
         })
         self.assertTrue(form.is_valid())
 
 
-class TodoFormFieldWidgetsTests(TestCase):
+class TodoFormFieldWidgetsTests(SimpleTestCase):
     """Tests for form field widgets and CSS classes."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build one unbound form; the tests only read widget metadata."""
+        super().setUpClass()
+        cls._form = TodoForm()
+
     def test_form_has_bootstrap_classes(self):
         """Test that form fields have Bootstrap CSS classes."""
-        form = TodoForm()
-        self.assertIn('form-control', str(form['title']))
-        self.assertIn('form-control', str(form['description']))
-        self.assertIn('form-control', str(form['due_date']))
+        form = self._form
+        for name in ('title', 'description', 'due_date'):
+            self.assertEqual(form.fields[name].widget.attrs.get('class'), 'form-control')
 
     def test_title_field_has_placeholder(self):
         """Test that title field has placeholder."""
-        form = TodoForm()
-        self.assertIn('placeholder', str(form['title']))
-        self.assertIn('Enter task title', str(form['title']))
+        form = self._form
+        self.assertEqual(form.fields['title'].widget.attrs.get('placeholder'), 'Enter task title')
 
     def test_description_field_has_placeholder(self):
         """Test that description field has placeholder."""
-        form = TodoForm()
-        self.assertIn('placeholder', str(form['description']))
-        self.assertIn('Enter task description', str(form['description']))
+        form = self._form
+        self.assertEqual(
+            form.fields['description'].widget.attrs.get('placeholder'),
+            'Enter task description'
+        )
 
     def test_description_field_has_rows_attribute(self):
         """Test that description field has rows attribute."""
-        form = TodoForm()
-        self.assertIn('rows', str(form['description']))
+        form = self._form
+        self.assertIn('rows', form.fields['description'].widget.attrs)
 
     def test_due_date_field_is_date_input(self):
         """Test that due_date field uses date input type."""
-        form = TodoForm()
-        self.assertIn('type="date"', str(form['due_date']))
+        form = self._form
+        self.assertEqual(form.fields['due_date'].widget.input_type, 'date')
 
 
-class TodoFormSpecialCharactersTests(TestCase):
+class TodoFormSpecialCharactersTests(SimpleTestCase):
     """Tests for handling special characters and XSS prevention."""
 
     def test_form_accepts_special_characters_in_title(self):
@@ -214,7 +231,7 @@ class TodoFormSpecialCharactersTests(TestCase):
         self.assertTrue(form.is_valid())
 
 
-class TodoFormEdgeCasesTests(TestCase):
+class TodoFormEdgeCasesTests(SimpleTestCase):
     """Tests for edge cases and boundary conditions."""
 
     def test_form_with_whitespace_only_title(self):
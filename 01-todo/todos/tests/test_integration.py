@@ -5,20 +5,26 @@ These tests verify complete user workflows across multiple views,
 ensuring components work together correctly end-to-end.
 """
 
-from django.test import TestCase, Client
-from django.urls import reverse
+from django.test import TestCase
 from django.utils import timezone
 from datetime import timedelta
 from ..models import Todo
-from .conftest import create_todo, create_todo_with_due_date
+from .conftest import (
+    cached_reverse,
+    create_todo,
+    create_todo_with_due_date,
+    create_todos_bulk,
+)
 
 
 class TodoWorkflowIntegrationTests(TestCase):
     """Tests for complete user workflows."""
 
-    def setUp(self):
-        """Initialize test client."""
-        self.client = Client()
+    @classmethod
+    def setUpClass(cls):
+        """Compute today's date once for the whole class."""
+        super().setUpClass()
+        cls.today = timezone.now().date()
 
     def test_complete_todo_lifecycle(self):
         """
@@ -26,16 +32,17 @@ class TodoWorkflowIntegrationTests(TestCase):
 
         This tests a realistic user workflow.
         """
-        list_url = reverse('todo-list')
-        create_url = reverse('todo-create')
+        list_url = cached_reverse('todo-list')
+        create_url = cached_reverse('todo-create')
 
         # 1. Create a todo
         create_data = {
             'title': 'Complete Project',
             'description': 'Finish the TODO app',
-            'due_date': (timezone.now() + timedelta(days=7)).date()
+            'due_date': self.today + timedelta(days=7)
         }
-        response = self.client.post(create_url, create_data)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(create_url, create_data)
         self.assertEqual(response.status_code, 302)  # Redirect
 
         # Verify todo was created
@@ -44,12 +51,13 @@ class TodoWorkflowIntegrationTests(TestCase):
         self.assertEqual(todo.title, 'Complete Project')
 
         # 2. View todo in list
-        response = self.client.get(list_url)
+        with self.assertNumQueries(3):
+            response = self.client.get(list_url)
         self.assertEqual(response.status_code, 200)
         self.assertIn(todo, response.context['todos'])
 
         # 3. Edit the todo
-        edit_url = reverse('todo-edit', args=[todo.pk])
+        edit_url = cached_reverse('todo-edit', todo.pk)
         edit_data = {
             'title': 'Complete Project - Updated',
             'description': 'Finish the TODO app with tests'
@@ -62,7 +70,7 @@ class TodoWorkflowIntegrationTests(TestCase):
         self.assertEqual(todo.title, 'Complete Project - Updated')
 
         # 4. Mark as done
-        resolve_url = reverse('todo-resolve', args=[todo.pk])
+        resolve_url = cached_reverse('todo-resolve', todo.pk)
         response = self.client.post(resolve_url)
         self.assertEqual(response.status_code, 302)
 
@@ -76,7 +84,7 @@ class TodoWorkflowIntegrationTests(TestCase):
         self.assertFalse(todo.resolved)
 
         # 6. Delete the todo
-        delete_url = reverse('todo-delete', args=[todo.pk])
+        delete_url = cached_reverse('todo-delete', todo.pk)
         response = self.client.post(delete_url)
         self.assertEqual(response.status_code, 302)
 
@@ -89,37 +97,37 @@ class TodoWorkflowIntegrationTests(TestCase):
 
         Verifies that operations on one todo don't affect others.
         """
-        create_url = reverse('todo-create')
-        list_url = reverse('todo-list')
-
-        # Create 3 todos
+        # Create 3 todos directly; the create view itself is exercised
+        # by test_complete_todo_lifecycle
         todos_data = [
-            {'title': 'Task 1', 'due_date': (timezone.now() + timedelta(days=1)).date()},
-            {'title': 'Task 2', 'due_date': (timezone.now() + timedelta(days=2)).date()},
-            {'title': 'Task 3', 'due_date': (timezone.now() + timedelta(days=3)).date()},
+            {'title': 'Task 1', 'due_date': self.today + timedelta(days=1)},
+            {'title': 'Task 2', 'due_date': self.today + timedelta(days=2)},
+            {'title': 'Task 3', 'due_date': self.today + timedelta(days=3)},
         ]
 
-        for data in todos_data:
-            self.client.post(create_url, data)
+        Todo.objects.bulk_create([
+            Todo(title=data['title'], due_date=data['due_date'])
+            for data in todos_data
+        ])
 
         # Verify all created
         self.assertEqual(Todo.objects.count(), 3)
 
         # Resolve first todo
-        todo1 = Todo.objects.first()
-        resolve_url = reverse('todo-resolve', args=[todo1.pk])
+        todo1 = Todo.objects.only('pk', 'resolved').first()
+        resolve_url = cached_reverse('todo-resolve', todo1.pk)
         self.client.post(resolve_url)
 
         # Verify only first is resolved
         todo1.refresh_from_db()
-        todos = Todo.objects.all()
+        todos = list(Todo.objects.only('pk', 'resolved').order_by('pk'))
         self.assertTrue(todo1.resolved)
         for todo in todos[1:]:
             self.assertFalse(todo.resolved)
 
         # Delete second todo
         todo2 = todos[1]
-        delete_url = reverse('todo-delete', args=[todo2.pk])
+        delete_url = cached_reverse('todo-delete', todo2.pk)
         self.client.post(delete_url)
 
         # Verify only 2 remain
@@ -127,15 +135,17 @@ class TodoWorkflowIntegrationTests(TestCase):
 
     def test_create_and_view_immediately(self):
         """Test that created todos appear in list view immediately."""
-        create_url = reverse('todo-create')
-        list_url = reverse('todo-list')
+        create_url = cached_reverse('todo-create')
+        list_url = cached_reverse('todo-list')
 
         # Create todo
         create_data = {'title': 'Immediate Task'}
-        self.client.post(create_url, create_data)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(create_url, create_data)
 
         # View list
-        response = self.client.get(list_url)
+        with self.assertNumQueries(3):
+            response = self.client.get(list_url)
         todos = response.context['todos']
 
         # Verify it appears
@@ -145,8 +155,8 @@ class TodoWorkflowIntegrationTests(TestCase):
     def test_edit_and_verify_changes(self):
         """Test that edited todos show updated data in list."""
         todo = create_todo(title="Original", description="Original Desc")
-        edit_url = reverse('todo-edit', args=[todo.pk])
-        list_url = reverse('todo-list')
+        edit_url = cached_reverse('todo-edit', todo.pk)
+        list_url = cached_reverse('todo-list')
 
         # Edit todo
         edit_data = {
@@ -156,7 +166,8 @@ class TodoWorkflowIntegrationTests(TestCase):
         self.client.post(edit_url, edit_data)
 
         # View list
-        response = self.client.get(list_url)
+        with self.assertNumQueries(3):
+            response = self.client.get(list_url)
         updated_todo = response.context['todos'][0]
 
         self.assertEqual(updated_todo.title, 'Updated')
@@ -166,27 +177,26 @@ class TodoWorkflowIntegrationTests(TestCase):
 class TodoPermissionsAndSecurityTests(TestCase):
     """Tests for security-related scenarios."""
 
-    def setUp(self):
-        """Initialize test client."""
-        self.client = Client()
-
-    def test_access_edit_nonexistent_todo(self):
-        """Test that accessing non-existent todo returns 404."""
-        edit_url = reverse('todo-edit', args=[9999])
-        response = self.client.get(edit_url)
-        self.assertEqual(response.status_code, 404)
-
-    def test_access_delete_nonexistent_todo(self):
-        """Test that deleting non-existent todo returns 404."""
-        delete_url = reverse('todo-delete', args=[9999])
-        response = self.client.get(delete_url)
-        self.assertEqual(response.status_code, 404)
-
-    def test_resolve_nonexistent_todo(self):
-        """Test that resolving non-existent todo returns 404."""
-        resolve_url = reverse('todo-resolve', args=[9999])
-        response = self.client.post(resolve_url)
-        self.assertEqual(response.status_code, 404)
+    missing_todo_routes = [
+        ('todo-edit', 'GET'),
+        ('todo-delete', 'GET'),
+        ('todo-resolve', 'POST'),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        """Resolve the URLs for a todo that doesn't exist once per class."""
+        super().setUpClass()
+        cls.missing_todo_urls = {
+            name: cached_reverse(name, 9999) for name, _ in cls.missing_todo_routes
+        }
+
+    def test_nonexistent_todo_routes_return_404(self):
+        """Test that editing, deleting or resolving a missing todo returns 404."""
+        for name, method in self.missing_todo_routes:
+            with self.subTest(name=name):
+                response = self.client.generic(method, self.missing_todo_urls[name])
+                self.assertEqual(response.status_code, 404)
 
     def test_html_in_title_is_escaped(self):
         """Test that HTML in todo title is stored safely."""
@@ -197,10 +207,11 @@ class TodoPermissionsAndSecurityTests(TestCase):
         self.assertEqual(todo.title, title)
 
         # Verify list view doesn't execute it
-        list_url = reverse('todo-list')
-        response = self.client.get(list_url)
+        list_url = cached_reverse('todo-list')
+        with self.assertNumQueries(3):
+            response = self.client.get(list_url)
         # Django templates auto-escape by default
-        self.assertIn(str(todo.pk), str(response.content))
+        self.assertIn(str(todo.pk).encode(), response.content)
 
 
 class TodoDataPersistenceTests(TestCase):
@@ -250,32 +261,47 @@ class TodoDataPersistenceTests(TestCase):
 class TodoListOrderingTests(TestCase):
     """Tests for todo list ordering and sorting."""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Create the todos shared by the ordering tests."""
+        today = timezone.now().date()
+        cls.todo_no_date, cls.todo_3, cls.todo_7 = create_todos_bulk([
+            {'title': "No Date", 'due_date': None},
+            {'title': "Todo due in 3 days", 'due_date': today + timedelta(days=3)},
+            {'title': "Todo due in 7 days", 'due_date': today + timedelta(days=7)},
+        ])
+
     def test_todos_displayed_in_due_date_order(self):
         """Test that todos in list are ordered by due date."""
-        # Create todos with specific due dates
-        todo_no_date = create_todo(title="No Date", due_date=None)
-        todo_3_days = create_todo_with_due_date(days_from_now=3)
-        todo_7_days = create_todo_with_due_date(days_from_now=7)
-
-        list_url = reverse('todo-list')
-        response = self.client.get(list_url)
+        list_url = cached_reverse('todo-list')
+        # The ETag aggregate, a COUNT for the paginator and one query for
+        # the page, however many rows there are
+        with self.assertNumQueries(3):
+            response = self.client.get(list_url)
         todos = list(response.context['todos'])
 
         # Verify order
+        self.assertEqual(
+            [todo.pk for todo in todos],
+            [self.todo_no_date.pk, self.todo_3.pk, self.todo_7.pk]
+        )
         self.assertIsNone(todos[0].due_date)
         self.assertLess(todos[1].due_date, todos[2].due_date)
 
-    def test_resolved_todos_maintain_order(self):
-        """Test that resolved status doesn't affect ordering."""
-        todo1 = create_todo_with_due_date(days_from_now=5)
-        todo2 = create_todo_with_due_date(days_from_now=10)
-        todo2.resolved = True
-        todo2.save()
+    def test_resolved_todos_listed_after_open_ones(self):
+        """Test that resolved todos follow the open ones, whatever their due date."""
+        # Rows mutated by the test are created here, not in setUpTestData
+        todo_5 = create_todo_with_due_date(days_from_now=5)
+        todo_5.resolved = True
+        todo_5.save()
 
-        list_url = reverse('todo-list')
-        response = self.client.get(list_url)
+        list_url = cached_reverse('todo-list')
+        with self.assertNumQueries(3):
+            response = self.client.get(list_url)
         todos = list(response.context['todos'])
 
-        # Order should still be by due date, not resolved status
-        self.assertEqual(todos[0].pk, todo1.pk)
-        self.assertEqual(todos[1].pk, todo2.pk)
+        # Open todos by due date first, then the resolved one
+        self.assertEqual(
+            [todo.pk for todo in todos],
+            [self.todo_no_date.pk, self.todo_3.pk, self.todo_7.pk, todo_5.pk]
+        )
@@ -5,11 +5,15 @@ This module tests the data layer, ensuring the model correctly
 stores and retrieves data with proper validation and defaults.
 """
 
-from django.test import TestCase
+from unittest.mock import patch
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, TestCase
 from django.utils import timezone
 from datetime import timedelta
 from ..models import Todo
-from .conftest import create_todo, create_todo_with_due_date
+from .conftest import (
+    LONG_TITLE_200, LONG_TITLE_201, create_todo, create_todo_with_due_date,
+)
 
 
 class TodoModelCreationTests(TestCase):
@@ -40,25 +44,28 @@ class TodoModelCreationTests(TestCase):
         self.assertEqual(todo.due_date, due_date)
         self.assertFalse(todo.resolved)
 
-    def test_default_resolved_is_false(self):
-        """Test that new todos are not resolved by default."""
-        todo = create_todo()
+    def test_defaults_for_optional_fields(self):
+        """Test the defaults for resolved, description and due_date in one insert."""
+        todo = create_todo(title="Defaults")
         self.assertFalse(todo.resolved)
+        self.assertIsNone(todo.description)
+        self.assertIsNone(todo.due_date)
 
     def test_title_max_length_validation(self):
         """Test that title respects max_length constraint."""
-        long_title = "A" * 200  # Max length
-        todo = create_todo(title=long_title)
+        todo = create_todo(title=LONG_TITLE_200)
         self.assertEqual(len(todo.title), 200)
 
+
+class TodoModelValidationTests(SimpleTestCase):
+    """Tests for model validation that don't need the database."""
+
     def test_title_cannot_exceed_max_length(self):
-        """Test that title exceeding max_length fails."""
-        long_title = "A" * 201  # Over max length
-        with self.assertRaises(Exception):
-            create_todo(title=long_title)
-            todo = Todo.objects.get(title__startswith="A")
-            # Force full_clean to validate
+        """Test that title exceeding max_length fails validation."""
+        todo = Todo(title=LONG_TITLE_201)
+        with self.assertRaises(ValidationError) as cm:
             todo.full_clean()
+        self.assertIn('title', cm.exception.message_dict)
 
 
 class TodoModelFieldsTests(TestCase):
@@ -80,12 +87,11 @@ class TodoModelFieldsTests(TestCase):
         todo = create_todo(title="Original Title")
         original_updated_at = todo.updated_at
 
-        # Wait a moment and update
-        import time
-        time.sleep(0.01)
-
+        # Move the clock forward instead of sleeping
         todo.title = "Updated Title"
-        todo.save()
+        later = original_updated_at + timedelta(seconds=1)
+        with patch('django.utils.timezone.now', return_value=later):
+            todo.save()
 
         self.assertNotEqual(todo.updated_at, original_updated_at)
         self.assertGreater(todo.updated_at, original_updated_at)
@@ -100,46 +106,24 @@ class TodoModelFieldsTests(TestCase):
 
         self.assertEqual(todo.created_at, original_created_at)
 
-    def test_description_can_be_null(self):
-        """Test that description field accepts null values."""
-        todo = create_todo(title="No Description", description=None)
-        self.assertIsNone(todo.description)
-
     def test_description_can_be_empty_string(self):
         """Test that description field accepts empty strings."""
         todo = create_todo(title="Empty Description", description="")
         self.assertEqual(todo.description, "")
 
-    def test_due_date_can_be_null(self):
-        """Test that due_date field accepts null values."""
-        todo = create_todo(title="No Due Date", due_date=None)
-        self.assertIsNone(todo.due_date)
-
-    def test_past_due_dates_are_allowed(self):
-        """Test that past dates can be set as due dates."""
-        past_date = (timezone.now() - timedelta(days=10)).date()
-        todo = create_todo(title="Past Due", due_date=past_date)
-        self.assertEqual(todo.due_date, past_date)
-
-    def test_future_due_dates_are_allowed(self):
-        """Test that future dates can be set as due dates."""
-        future_date = (timezone.now() + timedelta(days=30)).date()
-        todo = create_todo(title="Future Due", due_date=future_date)
-        self.assertEqual(todo.due_date, future_date)
-
 
-class TodoModelStringRepresentationTests(TestCase):
+class TodoModelStringRepresentationTests(SimpleTestCase):
     """Tests for model string representation."""
 
     def test_todo_string_representation(self):
         """Test the __str__ method returns the title."""
-        todo = create_todo(title="My Todo Title")
+        todo = Todo(title="My Todo Title")
         self.assertEqual(str(todo), "My Todo Title")
 
     def test_todo_string_representation_with_special_characters(self):
         """Test __str__ with special characters."""
         title = "Todo with 🎯 emoji & special chars!"
-        todo = create_todo(title=title)
+        todo = Todo(title=title)
         self.assertEqual(str(todo), title)
 
 
@@ -176,14 +160,16 @@ class TodoModelResolvedStatusTests(TestCase):
 class TodoModelOrderingTests(TestCase):
     """Tests for model ordering and default querysets."""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Create todos with specific due dates in random order."""
+        cls.todo_no_date = create_todo(title="No Date", due_date=None)
+        cls.todo_future = create_todo_with_due_date(days_from_now=30)
+        cls.todo_soon = create_todo_with_due_date(days_from_now=5)
+
     def test_todos_ordered_by_due_date(self):
         """Test that todos are ordered by due_date by default."""
-        # Create todos with specific due dates in random order
-        todo_no_date = create_todo(title="No Date", due_date=None)
-        todo_future = create_todo_with_due_date(days_from_now=30)
-        todo_soon = create_todo_with_due_date(days_from_now=5)
-
-        todos = Todo.objects.all()
+        todos = list(Todo.objects.all())
 
         # Todos without due_date come first (NULL values sort first in most databases)
         self.assertIsNone(todos[0].due_date)
@@ -192,13 +178,16 @@ class TodoModelOrderingTests(TestCase):
 
     def test_multiple_todos_same_due_date(self):
         """Test handling of multiple todos with the same due date."""
-        due_date = (timezone.now() + timedelta(days=5)).date()
+        # A date no shared fixture uses
+        due_date = (timezone.now() + timedelta(days=10)).date()
         todo1 = create_todo(title="Task 1", due_date=due_date)
         todo2 = create_todo(title="Task 2", due_date=due_date)
 
-        todos = list(Todo.objects.filter(due_date=due_date))
-        self.assertEqual(len(todos), 2)
-        self.assertEqual(todos[0].due_date, todos[1].due_date)
+        dates = list(
+            Todo.objects.filter(due_date=due_date).values_list('due_date', flat=True)
+        )
+        self.assertEqual(len(dates), 2)
+        self.assertEqual(dates[0], dates[1])
 
 
 class TodoModelTitleUniquenessTests(TestCase):
@@ -210,9 +199,3 @@ class TodoModelTitleUniquenessTests(TestCase):
         create_todo(title="Duplicate Task")
 
         self.assertEqual(Todo.objects.filter(title="Duplicate Task").count(), 2)
-
-    def test_long_description_handling(self):
-        """Test that very long descriptions are handled correctly."""
-        long_description = "A" * 5000
-        todo = create_todo(title="Long Description", description=long_description)
-        self.assertEqual(len(todo.description), 5000)
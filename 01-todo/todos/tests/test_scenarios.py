@@ -5,12 +5,14 @@ This module tests unusual situations, boundary conditions,
 and business logic edge cases.
 """
 
-from django.test import TestCase, Client
-from django.urls import reverse
+from django.test import SimpleTestCase, TestCase, tag
 from django.utils import timezone
 from datetime import timedelta, date
+from ..forms import TodoForm
 from ..models import Todo
-from .conftest import create_todo
+from .conftest import (
+    LONG_TITLE_200, create_todo, create_many_todos, resolved_counts,
+)
 
 
 class TodoBoundaryTests(TestCase):
@@ -23,8 +25,7 @@ class TodoBoundaryTests(TestCase):
 
     def test_create_todo_with_maximum_title(self):
         """Test creating todo with maximum length title."""
-        max_title = "A" * 200
-        todo = create_todo(title=max_title)
+        todo = create_todo(title=LONG_TITLE_200)
         self.assertEqual(len(todo.title), 200)
 
     def test_create_todo_with_empty_description(self):
@@ -32,11 +33,20 @@ class TodoBoundaryTests(TestCase):
         todo = create_todo(title="Test", description="")
         self.assertEqual(todo.description, "")
 
-    def test_create_todo_with_very_large_description(self):
-        """Test creating todo with very large description."""
-        large_desc = "A" * 100000  # 100KB of text
-        todo = create_todo(title="Test", description=large_desc)
-        self.assertEqual(len(todo.description), 100000)
+    def test_create_todo_with_description_sizes(self):
+        """Test descriptions from one character up to 1KB of text."""
+        for size in [1, 200, 1024]:
+            with self.subTest(size=size):
+                todo = create_todo(title="Test", description="A" * size)
+                self.assertEqual(len(todo.description), size)
+
+    @tag('slow')
+    def test_create_todo_with_large_descriptions(self):
+        """Test descriptions of 5KB and 100KB of text."""
+        for size in [5_000, 100_000]:
+            with self.subTest(size=size):
+                todo = create_todo(title="Test", description="A" * size)
+                self.assertEqual(len(todo.description), size)
 
     def test_same_title_different_todos(self):
         """Test that multiple todos can have identical titles."""
@@ -47,17 +57,19 @@ class TodoBoundaryTests(TestCase):
         self.assertEqual(todo1.title, todo2.title)
         self.assertNotEqual(todo1.pk, todo2.pk)
 
-    def test_due_date_very_far_in_future(self):
-        """Test due date far in the future."""
-        far_future = date(year=2099, month=12, day=31)
-        todo = create_todo(title="Future Task", due_date=far_future)
-        self.assertEqual(todo.due_date, far_future)
-
-    def test_due_date_very_far_in_past(self):
-        """Test due date far in the past."""
-        far_past = date(year=1970, month=1, day=1)
-        todo = create_todo(title="Ancient Task", due_date=far_past)
-        self.assertEqual(todo.due_date, far_past)
+    def test_due_date_ranges(self):
+        """Test past, future and far-off dates can all be set as due dates."""
+        today = timezone.now().date()
+        cases = [
+            ('past', today - timedelta(days=10)),
+            ('future', today + timedelta(days=30)),
+            ('far_future', date(year=2099, month=12, day=31)),
+            ('far_past', date(year=1970, month=1, day=1)),
+        ]
+        for name, due_date in cases:
+            with self.subTest(name=name):
+                todo = create_todo(title=f"Due {name}", due_date=due_date)
+                self.assertEqual(todo.due_date, due_date)
 
 
 class TodoConcurrencyTests(TestCase):
@@ -65,14 +77,11 @@ class TodoConcurrencyTests(TestCase):
 
     def test_create_multiple_todos_same_second(self):
         """Test creating multiple todos rapidly."""
-        todos = []
-        for i in range(10):
-            todo = create_todo(title=f"Task {i}")
-            todos.append(todo)
+        create_many_todos(10)
 
         self.assertEqual(Todo.objects.count(), 10)
         # Verify all have different PKs
-        pks = [t.pk for t in todos]
+        pks = list(Todo.objects.values_list('pk', flat=True))
         self.assertEqual(len(set(pks)), 10)
 
     def test_update_and_delete_same_todo_sequence(self):
@@ -85,7 +94,9 @@ class TodoConcurrencyTests(TestCase):
         todo.save()
 
         # Verify update
-        self.assertEqual(Todo.objects.get(pk=todo_id).title, "Updated")
+        with self.assertNumQueries(1):
+            todo.refresh_from_db(fields=['title'])
+        self.assertEqual(todo.title, "Updated")
 
         # Delete
         todo.delete()
@@ -97,17 +108,13 @@ class TodoConcurrencyTests(TestCase):
 class TodoDataValidationTests(TestCase):
     """Tests for data validation and type handling."""
 
-    def test_resolved_boolean_true(self):
-        """Test resolved field properly stores True."""
-        todo = create_todo(resolved=True)
-        self.assertIs(todo.resolved, True)
-        self.assertEqual(type(todo.resolved), bool)
-
-    def test_resolved_boolean_false(self):
-        """Test resolved field properly stores False."""
-        todo = create_todo(resolved=False)
-        self.assertIs(todo.resolved, False)
-        self.assertEqual(type(todo.resolved), bool)
+    def test_resolved_boolean_values(self):
+        """Test resolved field properly stores True and False."""
+        for value in (True, False):
+            with self.subTest(resolved=value):
+                todo = create_todo(resolved=value)
+                self.assertIs(todo.resolved, value)
+                self.assertEqual(type(todo.resolved), bool)
 
     def test_due_date_type_is_date(self):
         """Test that due_date is stored as date type."""
@@ -174,17 +181,15 @@ class TodoSpecialCharacterTests(TestCase):
         todo = create_todo(description=whitespace_text)
         self.assertEqual(todo.description, whitespace_text)
 
-    def test_null_bytes_in_title(self):
-        """Test handling of null bytes."""
-        # Most frameworks reject null bytes
-        try:
-            title_with_null = "Task\x00Name"
-            todo = create_todo(title=title_with_null)
-            # If it gets created, verify it's stored
-            self.assertIn("\x00", todo.title)
-        except (ValueError, TypeError):
-            # Null bytes should be rejected
-            pass
+
+class TodoNullCharacterTests(SimpleTestCase):
+    """Tests for rejecting null characters before they reach the database."""
+
+    def test_null_bytes_in_title_rejected(self):
+        """Test that the form rejects titles containing null bytes."""
+        form = TodoForm(data={'title': "Task\x00Name"})
+        self.assertFalse(form.is_valid())
+        self.assertIn('title', form.errors)
 
 
 class TodoStateTransitionTests(TestCase):
@@ -210,12 +215,16 @@ class TodoStateTransitionTests(TestCase):
         """Test toggling resolved status multiple times."""
         todo = create_todo(resolved=False)
 
-        for i in range(10):
-            todo.resolved = not todo.resolved
-            todo.save()
-            # After i+1 toggles, resolved should be True for odd numbers, False for even
-            expected_resolved = (i + 1) % 2 == 1
-            self.assertEqual(todo.resolved, expected_resolved)
+        # False -> True -> False covers both transitions
+        todo.resolved = True
+        todo.save(update_fields=['resolved'])
+        todo.refresh_from_db(fields=['resolved'])
+        self.assertTrue(todo.resolved)
+
+        todo.resolved = False
+        todo.save(update_fields=['resolved'])
+        todo.refresh_from_db(fields=['resolved'])
+        self.assertFalse(todo.resolved)
 
     def test_update_without_changing_resolved(self):
         """Test that updating other fields doesn't change resolved."""
@@ -237,34 +246,45 @@ class TodoStateTransitionTests(TestCase):
         self.assertTrue(todo.resolved)
 
 
-class TodoListFilteringTests(TestCase):
-    """Tests for list filtering and querying scenarios."""
+class TodoResolvedCountTests(TestCase):
+    """Tests for counting todos by resolved status."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a mix of resolved and unresolved todos shared by the tests."""
+        cls.todo1 = create_todo(title="Task 1", resolved=True)
+        cls.todo2 = create_todo(title="Task 2", resolved=False)
+        cls.todo3 = create_todo(title="Task 3", resolved=True)
+        cls.counts = resolved_counts()
 
     def test_count_resolved_todos(self):
         """Test that we can count resolved todos."""
-        create_todo(title="Task 1", resolved=True)
-        create_todo(title="Task 2", resolved=False)
-        create_todo(title="Task 3", resolved=True)
-
-        resolved_count = Todo.objects.filter(resolved=True).count()
-        self.assertEqual(resolved_count, 2)
+        self.assertEqual(self.counts['resolved'], 2)
 
     def test_count_unresolved_todos(self):
         """Test that we can count unresolved todos."""
-        create_todo(title="Task 1", resolved=True)
-        create_todo(title="Task 2", resolved=False)
-        create_todo(title="Task 3", resolved=False)
+        self.assertEqual(self.counts['unresolved'], 1)
 
-        unresolved_count = Todo.objects.filter(resolved=False).count()
-        self.assertEqual(unresolved_count, 2)
+
+class TodoListFilteringTests(TestCase):
+    """Tests for list filtering and querying scenarios."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Compute the reference dates once for the whole class."""
+        cls.today = timezone.now().date()
+        cls.tomorrow = cls.today + timedelta(days=1)
+        cls.soon = cls.today + timedelta(days=3)
+        cls.next_week = cls.today + timedelta(days=7)
+        cls.later = cls.today + timedelta(days=10)
+        cls.far_future = cls.today + timedelta(days=30)
 
     def test_filter_todos_by_due_date(self):
         """Test filtering todos by due date."""
-        soon_date = (timezone.now() + timedelta(days=3)).date()
-        create_todo(title="Soon", due_date=soon_date)
-        create_todo(title="Later", due_date=(timezone.now() + timedelta(days=10)).date())
+        create_todo(title="Soon", due_date=self.soon)
+        create_todo(title="Later", due_date=self.later)
 
-        soon_todos = Todo.objects.filter(due_date=soon_date)
+        soon_todos = Todo.objects.filter(due_date=self.soon)
         self.assertEqual(soon_todos.count(), 1)
 
     def test_filter_todos_without_due_date(self):
@@ -277,16 +297,14 @@ class TodoListFilteringTests(TestCase):
 
     def test_todos_with_upcoming_due_dates(self):
         """Test finding todos with due dates in next 7 days."""
-        now = timezone.now().date()
-
-        create_todo(title="Today", due_date=now)
-        create_todo(title="Tomorrow", due_date=now + timedelta(days=1))
-        create_todo(title="Next Week", due_date=now + timedelta(days=7))
-        create_todo(title="Far Future", due_date=now + timedelta(days=30))
+        create_todo(title="Today", due_date=self.today)
+        create_todo(title="Tomorrow", due_date=self.tomorrow)
+        create_todo(title="Next Week", due_date=self.next_week)
+        create_todo(title="Far Future", due_date=self.far_future)
 
         upcoming = Todo.objects.filter(
-            due_date__gte=now,
-            due_date__lte=now + timedelta(days=7)
+            due_date__gte=self.today,
+            due_date__lte=self.next_week
         )
         self.assertEqual(upcoming.count(), 3)
 
@@ -296,22 +314,18 @@ class TodoQueryPerformanceTests(TestCase):
 
     def test_bulk_todo_creation(self):
         """Test creating many todos efficiently."""
-        todos = [create_todo(title=f"Task {i}") for i in range(100)]
+        create_many_todos(100)
         self.assertEqual(Todo.objects.count(), 100)
 
     def test_retrieve_all_todos(self):
         """Test retrieving all todos."""
-        for i in range(50):
-            create_todo(title=f"Task {i}")
-
+        create_many_todos(50)
         all_todos = Todo.objects.all()
         self.assertEqual(all_todos.count(), 50)
 
     def test_update_all_todos_resolved_status(self):
         """Test bulk update of todos."""
-        for i in range(20):
-            create_todo(title=f"Task {i}", resolved=False)
-
+        create_many_todos(20, resolved=False)
         Todo.objects.all().update(resolved=True)
-        resolved_count = Todo.objects.filter(resolved=True).count()
-        self.assertEqual(resolved_count, 20)
+        self.assertFalse(Todo.objects.filter(resolved=False).exists())
+        self.assertEqual(Todo.objects.count(), 20)
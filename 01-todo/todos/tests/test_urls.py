@@ -0,0 +1,62 @@
+"""
+Tests for Todo URL routing.
+
+This module checks that the app has a single canonical URLconf and that
+every named route resolves to the intended view.
+"""
+
+from importlib.util import find_spec
+from pathlib import Path
+from django.test import SimpleTestCase
+from django.urls import Resolver404, URLResolver, resolve
+from todo_project import urls as project_urls
+from .. import views
+from .conftest import cached_reverse
+
+
+class TodoURLConfTests(SimpleTestCase):
+    """Tests for where the todo URLconf is loaded from."""
+
+    def test_todos_urls_is_the_app_module(self):
+        """Test that todos.urls is loaded from the app package itself."""
+        spec = find_spec('todos.urls')
+        app_dir = Path(views.__file__).resolve().parent
+        self.assertEqual(Path(spec.origin).resolve(), app_dir / 'urls.py')
+
+    def test_todos_urls_included_once(self):
+        """Test that the project URLconf includes todos.urls exactly once."""
+        # include() imports a dotted path, so compare module names
+        included = [
+            getattr(pattern.urlconf_name, '__name__', None)
+            for pattern in project_urls.urlpatterns
+            if isinstance(pattern, URLResolver)
+        ]
+        self.assertEqual(included.count('todos.urls'), 1)
+
+
+class TodoURLRoutingTests(SimpleTestCase):
+    """Tests for resolving the named todo routes."""
+
+    routes = [
+        ('todo-list', (), views.TodoListView),
+        ('todo-create', (), views.TodoCreateView),
+        ('todo-edit', (1,), views.TodoUpdateView),
+        ('todo-delete', (1,), views.TodoDeleteView),
+        ('todo-resolve', (1,), views.TodoResolveView),
+        ('todo-bulk-delete', (), views.TodoBulkDeleteView),
+    ]
+
+    def test_named_routes_resolve_to_views(self):
+        """Test that each route name round-trips to its view class."""
+        for name, args, view_class in self.routes:
+            with self.subTest(name=name):
+                match = resolve(cached_reverse(name, *args))
+                self.assertEqual(match.url_name, name)
+                self.assertIs(match.func.view_class, view_class)
+
+    def test_pk_routes_require_digits(self):
+        """Test that per-todo routes don't match a non-numeric pk."""
+        for action in ('edit', 'delete', 'resolve'):
+            with self.subTest(action=action):
+                with self.assertRaises(Resolver404):
+                    resolve(f'/todos/abc/{action}/')
@@ -5,23 +5,22 @@ This module tests the presentation and routing layer,
 ensuring views handle HTTP requests/responses correctly.
 """
 
-from django.test import TestCase, Client
-from django.urls import reverse
+from django.conf import settings
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse, reverse_lazy
 from django.utils import timezone
 from datetime import timedelta
 from ..models import Todo
 from ..forms import TodoForm
-from .conftest import create_todo, create_todo_with_due_date, BaseTestCase
+from todo_project import settings as project_settings
+from .conftest import (
+    create_todo, create_todos_bulk, create_many_todos, BaseTestCase,
+)
 
 
 class TodoListViewTests(BaseTestCase):
     """Tests for the todo list view."""
 
-    def setUp(self):
-        """Set up test data."""
-        super().setUp()
-        self.list_url = reverse('todo-list')
-
     def test_list_view_get_request(self):
         """Test GET request to list view returns 200."""
         response = self.client.get(self.list_url)
@@ -34,11 +33,15 @@ class TodoListViewTests(BaseTestCase):
 
     def test_list_view_displays_all_todos(self):
         """Test that list view returns all created todos."""
-        todo1 = create_todo(title="Task 1")
-        todo2 = create_todo(title="Task 2")
-        todo3 = create_todo(title="Task 3")
-
-        response = self.client.get(self.list_url)
+        todo1, todo2, todo3 = create_todos_bulk([
+            {'title': "Task 1"},
+            {'title': "Task 2"},
+            {'title': "Task 3"},
+        ])
+
+        # The ETag aggregate, the paginator's COUNT and the page itself
+        with self.assertNumQueries(3):
+            response = self.client.get(self.list_url)
         todos = response.context['todos']
 
         self.assertEqual(len(todos), 3)
@@ -60,25 +63,87 @@ class TodoListViewTests(BaseTestCase):
 
     def test_list_view_todos_ordered_by_due_date(self):
         """Test that todos in list view are ordered by due date."""
-        create_todo(title="No Date", due_date=None)
-        create_todo_with_due_date(days_from_now=30)
-        create_todo_with_due_date(days_from_now=5)
+        today = self.now.date()
+        no_date, later, sooner = create_todos_bulk([
+            {'title': "No Date", 'due_date': None},
+            {'title': "Later", 'due_date': today + timedelta(days=30)},
+            {'title': "Sooner", 'due_date': today + timedelta(days=5)},
+        ])
 
         response = self.client.get(self.list_url)
         todos = list(response.context['todos'])
 
-        # First should be without due date
-        self.assertIsNone(todos[0].due_date)
+        # Todos without a due date come first, then by ascending due date
+        self.assertEqual(
+            [todo.pk for todo in todos],
+            [no_date.pk, sooner.pk, later.pk]
+        )
+
+    def test_list_view_is_paginated(self):
+        """Test that the list view splits todos into pages of 50."""
+        create_many_todos(51)
+
+        response = self.client.get(self.list_url)
+        self.assertTrue(response.context['is_paginated'])
+        self.assertEqual(len(response.context['todos']), 50)
+
+        response = self.client.get(self.list_url, {'page': 2})
+        self.assertEqual(len(response.context['todos']), 1)
+        # Emptying page 2 in place sends the browser back to page 1
+        self.assertEqual(response.context['page_obj'].previous_page_number(), 1)
+
+
+class TodoListConditionalGetTests(BaseTestCase):
+    """Tests for the list view's ETag handling."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the todo once per class; each test gets its own copy."""
+        cls.todo = create_todo(title="Task 1")
+        cls.resolve_url = reverse('todo-resolve', args=[cls.todo.pk])
+        cls.delete_url = reverse('todo-delete', args=[cls.todo.pk])
+
+    def test_list_view_unchanged_returns_not_modified(self):
+        """Test that a repeat GET with a matching ETag gets a bare 304."""
+        etag = self.client.get(self.list_url)['ETag']
+
+        # Only the ETag aggregate runs; the page isn't queried or rendered
+        with self.assertNumQueries(1):
+            response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_list_view_etag_changes_with_todos(self):
+        """Test that creating, resolving or deleting a todo changes the ETag."""
+        etags = [self.client.get(self.list_url)['ETag']]
+
+        create_todo(title="Task 2")
+        etags.append(self.client.get(self.list_url)['ETag'])
+        self.client.post(self.resolve_url)
+        etags.append(self.client.get(self.list_url)['ETag'])
+        self.client.post(self.delete_url)
+        etags.append(self.client.get(self.list_url)['ETag'])
+
+        self.assertEqual(len(set(etags)), len(etags))
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etags[0])
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(MIDDLEWARE=project_settings.MIDDLEWARE)
+    def test_list_view_etag_changes_with_csrf_cookie(self):
+        """Test that a new CSRF cookie invalidates pages holding the old token."""
+        self.client.cookies[settings.CSRF_COOKIE_NAME] = 'a' * 32
+        etag = self.client.get(self.list_url)['ETag']
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.client.cookies[settings.CSRF_COOKIE_NAME] = 'b' * 32
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
 
 
 class TodoCreateViewTests(BaseTestCase):
     """Tests for creating todos."""
 
-    def setUp(self):
-        """Set up test URLs."""
-        super().setUp()
-        self.create_url = reverse('todo-create')
-        self.list_url = reverse('todo-list')
+    create_url = reverse_lazy('todo-create')
 
     def test_create_view_get_request(self):
         """Test GET request to create view displays the form."""
@@ -93,9 +158,9 @@ class TodoCreateViewTests(BaseTestCase):
         response = self.client.post(self.create_url, data)
 
         self.assertEqual(response.status_code, 302)
-        self.assertEqual(Todo.objects.count(), 1)
-        todo = Todo.objects.first()
-        self.assertEqual(todo.title, 'My First Todo')
+        # Look the row up by title so leftover rows can't affect the test
+        todo = Todo.objects.get(title='My First Todo')
+        self.assertIsNone(todo.due_date)
 
     def test_create_todo_with_all_fields(self):
         """Test creating todo with all fields."""
@@ -107,7 +172,7 @@ class TodoCreateViewTests(BaseTestCase):
         }
         response = self.client.post(self.create_url, data)
 
-        todo = Todo.objects.first()
+        todo = Todo.objects.only('title', 'description', 'due_date').get()
         self.assertEqual(todo.title, 'Complete Todo')
         self.assertEqual(todo.description, 'This is detailed')
         self.assertEqual(todo.due_date, due_date)
@@ -119,7 +184,8 @@ class TodoCreateViewTests(BaseTestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(Todo.objects.count(), 0)
-        self.assertFormError(response, 'form', 'title', 'This field is required.')
+        form = response.context['form']
+        self.assertTrue(form.errors['title'])
 
     def test_create_todo_redirects_to_list(self):
         """Test redirect after successful creation."""
@@ -134,7 +200,7 @@ class TodoCreateViewTests(BaseTestCase):
         data = {'title': 'No Description', 'description': ''}
         response = self.client.post(self.create_url, data)
 
-        todo = Todo.objects.first()
+        todo = Todo.objects.only('description').get()
         self.assertEqual(todo.description, '')
 
     def test_create_todo_with_empty_due_date(self):
@@ -142,7 +208,7 @@ class TodoCreateViewTests(BaseTestCase):
         data = {'title': 'No Due Date', 'due_date': ''}
         response = self.client.post(self.create_url, data)
 
-        todo = Todo.objects.first()
+        todo = Todo.objects.only('due_date').get()
         self.assertIsNone(todo.due_date)
 
     def test_create_todo_with_past_due_date(self):
@@ -151,22 +217,23 @@ class TodoCreateViewTests(BaseTestCase):
         data = {'title': 'Past Task', 'due_date': past_date}
         response = self.client.post(self.create_url, data)
 
-        todo = Todo.objects.first()
+        todo = Todo.objects.only('due_date').get()
         self.assertEqual(todo.due_date, past_date)
 
 
 class TodoEditViewTests(BaseTestCase):
     """Tests for editing todos."""
 
-    def setUp(self):
-        """Set up test data."""
-        super().setUp()
-        self.todo = create_todo(
+    nonexistent_url = reverse_lazy('todo-edit', args=[9999])
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the todo once per class; each test gets its own copy."""
+        cls.todo = create_todo(
             title="Original Title",
             description="Original Description"
         )
-        self.edit_url = reverse('todo-edit', args=[self.todo.pk])
-        self.list_url = reverse('todo-list')
+        cls.edit_url = reverse('todo-edit', args=[cls.todo.pk])
 
     def test_edit_view_get_request(self):
         """Test GET request to edit view displays form."""
@@ -220,8 +287,7 @@ class TodoEditViewTests(BaseTestCase):
 
     def test_edit_nonexistent_todo(self):
         """Test editing a todo that doesn't exist."""
-        nonexistent_url = reverse('todo-edit', args=[9999])
-        response = self.client.get(nonexistent_url)
+        response = self.client.get(self.nonexistent_url)
         self.assertEqual(response.status_code, 404)
 
     def test_edit_todo_without_changing_fields(self):
@@ -240,12 +306,13 @@ class TodoEditViewTests(BaseTestCase):
 class TodoDeleteViewTests(BaseTestCase):
     """Tests for deleting todos."""
 
-    def setUp(self):
-        """Set up test data."""
-        super().setUp()
-        self.todo = create_todo(title="To Delete")
-        self.delete_url = reverse('todo-delete', args=[self.todo.pk])
-        self.list_url = reverse('todo-list')
+    nonexistent_url = reverse_lazy('todo-delete', args=[9999])
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the todo once per class; each test gets its own copy."""
+        cls.todo = create_todo(title="To Delete")
+        cls.delete_url = reverse('todo-delete', args=[cls.todo.pk])
 
     def test_delete_view_get_request(self):
         """Test GET request to delete view shows confirmation."""
@@ -253,6 +320,12 @@ class TodoDeleteViewTests(BaseTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'todos/todo_confirm_delete.html')
 
+    def test_delete_view_get_with_confirm_header_not_allowed(self):
+        """Test that clients confirming in the list page must POST directly."""
+        response = self.client.get(self.delete_url, HTTP_X_CONFIRM='1')
+        self.assertEqual(response.status_code, 405)
+        self.assertTrue(Todo.objects.filter(pk=self.todo.pk).exists())
+
     def test_delete_todo_post_request(self):
         """Test POST request deletes the todo."""
         response = self.client.post(self.delete_url)
@@ -270,29 +343,31 @@ class TodoDeleteViewTests(BaseTestCase):
         response = self.client.post(self.delete_url)
 
         self.assertEqual(Todo.objects.count(), 1)
-        self.assertEqual(Todo.objects.first().title, "Keep This")
+        self.assertEqual(Todo.objects.only('title').get().title, "Keep This")
 
     def test_delete_nonexistent_todo(self):
         """Test deleting a todo that doesn't exist."""
-        nonexistent_url = reverse('todo-delete', args=[9999])
-        response = self.client.get(nonexistent_url)
+        response = self.client.get(self.nonexistent_url)
         self.assertEqual(response.status_code, 404)
 
 
 class TodoResolveViewTests(BaseTestCase):
     """Tests for marking todos as resolved."""
 
-    def setUp(self):
-        """Set up test data."""
-        super().setUp()
-        self.todo = create_todo(title="Test Todo", resolved=False)
-        self.resolve_url = reverse('todo-resolve', args=[self.todo.pk])
-        self.list_url = reverse('todo-list')
+    nonexistent_url = reverse_lazy('todo-resolve', args=[9999])
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the todo once per class; each test gets its own copy."""
+        cls.todo = create_todo(title="Test Todo", resolved=False)
+        cls.resolve_url = reverse('todo-resolve', args=[cls.todo.pk])
 
     def test_resolve_todo_unresolved_to_resolved(self):
         """Test toggling from unresolved to resolved."""
         self.assertFalse(self.todo.resolved)
-        response = self.client.post(self.resolve_url)
+        # The toggle is a single UPDATE, with no SELECT beforehand
+        with self.assertNumQueries(1):
+            response = self.client.post(self.resolve_url)
 
         self.todo.refresh_from_db()
         self.assertTrue(self.todo.resolved)
@@ -323,12 +398,29 @@ class TodoResolveViewTests(BaseTestCase):
         self.assertTrue(self.todo.resolved)
         self.assertFalse(todo2.resolved)
 
+    def test_resolve_touches_updated_at(self):
+        """Test that toggling resolved status refreshes updated_at."""
+        earlier = timezone.now() - timedelta(days=1)
+        Todo.objects.filter(pk=self.todo.pk).update(updated_at=earlier)
+
+        self.client.post(self.resolve_url)
+
+        self.todo.refresh_from_db()
+        self.assertGreater(self.todo.updated_at, earlier)
+
     def test_resolve_nonexistent_todo(self):
         """Test resolving a todo that doesn't exist."""
-        nonexistent_url = reverse('todo-resolve', args=[9999])
-        response = self.client.post(nonexistent_url)
+        response = self.client.post(self.nonexistent_url)
         self.assertEqual(response.status_code, 404)
 
+    def test_resolve_rejects_get(self):
+        """Test that GET is not allowed and leaves the todo unchanged."""
+        response = self.client.get(self.resolve_url)
+        self.assertEqual(response.status_code, 405)
+
+        self.todo.refresh_from_db()
+        self.assertFalse(self.todo.resolved)
+
     def test_resolve_idempotency(self):
         """Test that toggling multiple times works correctly."""
         # Unresolved -> Resolved
@@ -345,3 +437,64 @@ class TodoResolveViewTests(BaseTestCase):
         self.client.post(self.resolve_url)
         self.todo.refresh_from_db()
         self.assertTrue(self.todo.resolved)
+
+
+class TodoBulkDeleteViewTests(BaseTestCase):
+    """Tests for deleting several todos at once."""
+
+    bulk_delete_url = reverse_lazy('todo-bulk-delete')
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the todos once per class in a single INSERT."""
+        cls.todos = create_many_todos(3)
+
+    def test_bulk_delete_removes_selected_todos(self):
+        """Test that only the selected todos are deleted."""
+        selected = [str(todo.pk) for todo in self.todos[:2]]
+        response = self.client.post(self.bulk_delete_url, {'selected_todos': selected})
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.url, self.list_url)
+        self.assertEqual(
+            list(Todo.objects.values_list('pk', flat=True)),
+            [self.todos[2].pk]
+        )
+
+    def test_bulk_delete_query_count_does_not_scale(self):
+        """Test that deleting more todos doesn't issue more queries."""
+        for todos in (self.todos[:1], self.todos[1:]):
+            selected = [str(todo.pk) for todo in todos]
+            with self.subTest(selected=len(selected)), self.assertNumQueries(1):
+                self.client.post(self.bulk_delete_url, {'selected_todos': selected})
+
+        self.assertFalse(Todo.objects.exists())
+
+    def test_bulk_delete_ignores_invalid_ids(self):
+        """Test that non-numeric ids are skipped rather than causing an error."""
+        selected = ['abc', '', '-1', str(self.todos[0].pk)]
+        response = self.client.post(self.bulk_delete_url, {'selected_todos': selected})
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(Todo.objects.count(), 2)
+
+    def test_bulk_delete_ignores_out_of_range_ids(self):
+        """Test that ids too large for the pk column are skipped."""
+        selected = ['9' * 20, '9' * 5000, str(2**63), str(self.todos[0].pk)]
+        response = self.client.post(self.bulk_delete_url, {'selected_todos': selected})
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(Todo.objects.count(), 2)
+
+    def test_bulk_delete_without_selection(self):
+        """Test that submitting nothing deletes nothing."""
+        response = self.client.post(self.bulk_delete_url)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(Todo.objects.count(), 3)
+
+    def test_bulk_delete_rejects_get(self):
+        """Test that GET is not allowed on the bulk delete endpoint."""
+        response = self.client.get(self.bulk_delete_url)
+        self.assertEqual(response.status_code, 405)
+        self.assertEqual(Todo.objects.count(), 3)
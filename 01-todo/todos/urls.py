@@ -1,4 +1,4 @@
-from django.urls import path
+from django.urls import path, re_path
 from .views import (
     TodoListView,
     TodoCreateView,
@@ -11,8 +11,8 @@ from .views import (
 urlpatterns = [
     path('', TodoListView.as_view(), name='todo-list'),
     path('create/', TodoCreateView.as_view(), name='todo-create'),
-    path('<int:pk>/edit/', TodoUpdateView.as_view(), name='todo-edit'),
-    path('<int:pk>/delete/', TodoDeleteView.as_view(), name='todo-delete'),
-    path('<int:pk>/resolve/', TodoResolveView.as_view(), name='todo-resolve'),
+    re_path(r'^(?P<pk>[0-9]+)/edit/$', TodoUpdateView.as_view(), name='todo-edit'),
+    re_path(r'^(?P<pk>[0-9]+)/delete/$', TodoDeleteView.as_view(), name='todo-delete'),
+    re_path(r'^(?P<pk>[0-9]+)/resolve/$', TodoResolveView.as_view(), name='todo-resolve'),
     path('bulk-delete/', TodoBulkDeleteView.as_view(), name='todo-bulk-delete'),
 ]
@@ -1,15 +1,42 @@
-from django.shortcuts import render, redirect, get_object_or_404
+from django.conf import settings
+from django.db.models import Count, F, Max
+from django.http import Http404, HttpResponseNotAllowed
+from django.shortcuts import render, redirect
+from django.utils import timezone
+from django.utils.crypto import md5
+from django.utils.decorators import method_decorator
 from django.views import View
+from django.views.decorators.http import condition, require_POST
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView
 from django.urls import reverse_lazy
 from .models import Todo
 from .forms import TodoForm
 
 
+def todo_list_etag(request, *args, **kwargs):
+    """
+    Build the list page's ETag from the table's row count and latest update.
+
+    The count catches deletes, which leave the latest updated_at alone. The
+    query string (the page) and the CSRF cookie embedded in the page's
+    forms are part of it too.
+    """
+    stats = Todo.objects.aggregate(count=Count('pk'), last_updated=Max('updated_at'))
+    key = '|'.join([
+        str(stats['count']),
+        str(stats['last_updated']),
+        request.GET.urlencode(),
+        request.COOKIES.get(settings.CSRF_COOKIE_NAME, ''),
+    ])
+    return md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+@method_decorator(condition(etag_func=todo_list_etag), name='get')
 class TodoListView(ListView):
     model = Todo
     template_name = 'home.html'
     context_object_name = 'todos'
+    paginate_by = 50
 
 
 class TodoCreateView(CreateView):
@@ -31,18 +58,50 @@ class TodoDeleteView(DeleteView):
     template_name = 'todos/todo_confirm_delete.html'
     success_url = reverse_lazy('todo-list')
 
+    def get(self, request, *args, **kwargs):
+        # Only for outside clients (the list page POSTs directly): sending
+        # X-Confirm: 1 says the user already confirmed, so the no-JS
+        # confirmation page is refused and the client must POST instead.
+        if request.headers.get('X-Confirm') == '1':
+            return HttpResponseNotAllowed(['POST'])
+        return super().get(request, *args, **kwargs)
+
 
+@method_decorator(require_POST, name='dispatch')
 class TodoResolveView(View):
     def post(self, request, pk):
-        todo = get_object_or_404(Todo, pk=pk)
-        todo.resolved = not todo.resolved
-        todo.save()
+        # Toggle in a single UPDATE; auto_now only fires on save(), so
+        # updated_at is set explicitly.
+        updated = Todo.objects.filter(pk=pk).update(
+            resolved=~F('resolved'),
+            updated_at=timezone.now(),
+        )
+        if not updated:
+            raise Http404('No Todo matches the given query.')
         return redirect('todo-list')
 
 
+# Most ids a single bulk delete will accept; keeps the IN (...) list bounded.
+BULK_DELETE_MAX_IDS = 1000
+
+# Largest value a BigAutoField pk (a signed 64-bit integer) can hold.
+MAX_PK = 2**63 - 1
+
+
+@method_decorator(require_POST, name='dispatch')
 class TodoBulkDeleteView(View):
     def post(self, request):
-        selected_ids = request.POST.getlist('selected_todos')
+        # Drop anything that can't be a pk instead of letting the lookup
+        # raise; the length check keeps int() off absurdly long strings.
+        selected_ids = [
+            int(pk)
+            for pk in request.POST.getlist('selected_todos')[:BULK_DELETE_MAX_IDS]
+            if pk.isdecimal()
+            and len(pk) <= len(str(MAX_PK))
+            and int(pk) <= MAX_PK
+        ]
         if selected_ids:
+            # Todo has no signals or reverse relations, so delete() takes the
+            # fast path: a single DELETE with no collector SELECT beforehand.
             Todo.objects.filter(pk__in=selected_ids).delete()
         return redirect('todo-list')